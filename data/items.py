@@ -6,6 +6,7 @@ item has a rarity.
 Functions:
     load_items: Load items from the configuration file.
     update_items: Update the count of a specific item in a category.
+    flush_items: Write pending item counts to the configuration file.
     calculate_probabilities: Calculate and print the probabilities of each rarity in each category.
     sort_text_file: Sorts the items in the text file by category and item name.
     custom_sort: Determines the sort order of items based on their rarity and length.
@@ -13,6 +14,7 @@ Functions:
 
 import os
 import sys
+from collections import Counter
 from configparser import ConfigParser
 
 from utils.text_utils import clean_text, get_rarity  # pylint: disable=E0401
@@ -21,6 +23,23 @@ from utils.text_utils import clean_text, get_rarity  # pylint: disable=E0401
 base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
 items_file_path = os.path.join(base_dir, "items.txt")
 
+# Sort order of each rarity, built once rather than on every call that needs it
+RARITY_ORDER = {
+    "Uncommon": 0,
+    "Rare": 1,
+    "Very Rare": 2,
+    "Import": 3,
+    "Exotic": 4,
+    "Black Market": 5,
+}
+
+# Number of item updates kept in memory before they are written to the file
+FLUSH_INTERVAL = 10
+
+# Number of updates not yet written, and the in-memory copy of the items file
+# once it has been loaded
+_live_items = {"pending": 0}
+
 
 def load_items():
     """
@@ -34,6 +53,18 @@ def load_items():
     return items
 
 
+def _get_live_items():
+    """
+    Get the in-memory copy of the items, loading it from the file on first use.
+
+    Returns:
+        ConfigParser: The ConfigParser object holding the current item counts.
+    """
+    if "items" not in _live_items:
+        _live_items["items"] = load_items()
+    return _live_items["items"]
+
+
 def update_items(category, item):
     """
     Update the count of a specific item in a category.
@@ -41,8 +72,11 @@ def update_items(category, item):
     Args:
         category (str): The category of the item.
         item (str): The item to update.
+
+    Counts are kept in memory and written to the file every FLUSH_INTERVAL
+    updates, or when flush_items is called.
     """
-    items = load_items()
+    items = _get_live_items()
 
     # Clean the item name to remove unwanted characters
     item = clean_text(item)
@@ -59,44 +93,46 @@ def update_items(category, item):
     else:
         items.set(category, str(item), "1")
 
-    with open(items_file_path, "w", encoding="utf-8") as configfile:
-        items.write(configfile)
+    _live_items["pending"] += 1
+    if _live_items["pending"] >= FLUSH_INTERVAL:
+        flush_items()
+
+
+def flush_items():
+    """
+    Write pending item counts to the configuration file.
+
+    The file is written through sort_text_file so it stays sorted. Does nothing
+    if no updates have been made since the last flush.
+    """
+    if _live_items["pending"]:
+        sort_text_file()
 
 
 def calculate_probabilities():
     """
     Calculate and print the probabilities of each rarity in each category.
 
-    This function loads items from the configuration file, calculates the total
+    This function takes the items from the in-memory counts, calculates the total
     number of items in each category, and the number of items in each rarity.
     It then calculates the probability of each rarity in each category and
     prints them.
     """
-    categories = load_items()
+    categories = _get_live_items()
 
     for category in categories.sections():
         print(f"Category: {category}")
-        # Gets total number of items in category
-        total_items = sum(int(count) for count in categories[category].values())
-
-        # Creates a list of amount of items with rarity
-        rarities = {
-            "Uncommon": 0,
-            "Rare": 0,
-            "Very Rare": 0,
-            "Import": 0,
-            "Exotic": 0,
-            "Black Market": 0,
-        }
-
         # Adds items to their respective rarity
+        rarities = Counter()
         for item, count in categories[category].items():
-            rarity = get_rarity(item)
-            rarities[rarity] += int(count)
+            rarities[get_rarity(item)] += int(count)
+
+        # Gets total number of items in category from the rarity counts
+        total_items = sum(rarities.values())
 
         # Calculate probabilities
-        for rarity, count in rarities.items():
-            probability = count / total_items
+        for rarity in RARITY_ORDER:
+            probability = rarities[rarity] / total_items
             # Will not print probabilities of 0%
             if probability > 0:
                 print(f"{rarity}: {probability * 100:.2f}%")
@@ -108,37 +144,26 @@ def sort_text_file():
     """
     Sorts the items in the text file by category and item name.
 
-    This function reads the items from the text file, sorts them by category and item name,
-    and then overwrites the file with the sorted items.
+    This function sorts the items of each category by rarity and name length,
+    and then overwrites the file with the sorted items. The in-memory counts are
+    used so the file does not need to be read back and re-parsed.
     """
-    # Read the existing file and store its contents in a data structure
-    with open(items_file_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-
-    categories = {}
-
-    current_category = None
-    for line in lines:
-        line = line.strip()
-        if line.startswith("[") and line.endswith("]"):
-            current_category = line[1:-1]
-            categories[current_category] = []
-        elif line:  # Ignore empty lines
-            categories[current_category].append(line)
-
-    # Sort the items within each category
-    for category, items in categories.items():
-        sorted_items = sorted(items, key=custom_sort)
-        categories[category] = sorted_items
+    items = _get_live_items()
 
     # Overwrite the file with sorted contents
     with open(items_file_path, "w", encoding="utf-8") as file:
-        for category, items in categories.items():
+        for category in items.sections():
             file.write(f"[{category}]\n")
-            for item in items:
-                file.write(f"{item}\n")
+            lines = [
+                f"{item} = {count}" for item, count in items.items(category, raw=True)
+            ]
+            for line in sorted(lines, key=custom_sort):
+                file.write(f"{line}\n")
             file.write("\n")
 
+    # The file now holds every in-memory count, so nothing is left to flush
+    _live_items["pending"] = 0
+
 
 def custom_sort(item):
     """
@@ -151,14 +176,6 @@ def custom_sort(item):
         tuple: A tuple containing the index of the item's rarity in the
         rarities list and the length of the item.
     """
-    rarities = {
-        "Uncommon": 0,
-        "Rare": 1,
-        "Very Rare": 2,
-        "Import": 3,
-        "Exotic": 4,
-        "Black Market": 5,
-    }
     rarity = get_rarity(item)
-    rarity_index = rarities.get(rarity, len(rarities))
+    rarity_index = RARITY_ORDER.get(rarity, len(RARITY_ORDER))
     return rarity_index, len(item)
@@ -9,16 +9,23 @@ Functions:
     main: The main function of the script.
 """
 
+import atexit
+import os
 import sys
 import time
 
 import keyboard
 import pyautogui
 import pytesseract
-from PIL import ImageGrab
 
-from data.items import calculate_probabilities, sort_text_file, update_items
-from utils.image_utils import pixel_search_in_window
+from data.items import (
+    calculate_probabilities,
+    flush_items,
+    sort_text_file,
+    update_items,
+)
+from utils.image_utils import grab_region, pixel_search_in_window
+from utils.text_utils import parse_lines
 from utils.window_utils import get_rl_window
 
 # Config for Tesseract-OCR to extract text more accurately
@@ -35,13 +42,10 @@ ITEM_OPEN_COORDS = (725, 200, 1195, 240)
 
 def grab_image(window, coords):
     """Grab an image from the specified window and coordinates."""
-    return ImageGrab.grab(
-        bbox=(
-            window.left + coords[0],
-            window.top + coords[1],
-            window.left + coords[2],
-            window.top + coords[3],
-        )
+    # Each window position property queries the OS, so read the position once
+    left, top = window.topleft
+    return grab_region(
+        (left + coords[0], top + coords[1], left + coords[2], top + coords[3])
     )
 
 
@@ -54,6 +58,16 @@ def extract_text(img):
     )
 
 
+def stop_program():
+    """Save pending item counts and end the program from the stop hotkey."""
+    # Hotkeys run on the keyboard listener thread, where sys.exit would only end
+    # that thread, so flush here and then end the whole process
+    try:
+        flush_items()
+    finally:
+        os._exit(0)
+
+
 def handle_user_input():
     """Handle user input and return the selected option."""
     while True:
@@ -68,6 +82,12 @@ def handle_user_input():
 
 
 if __name__ == "__main__":
+    # Make sure counts still held in memory are saved however the program exits
+    atexit.register(flush_items)
+
+    # Handle of the Ctrl + C hotkey, registered once on the first run
+    STOP_HOTKEY = None
+
     while True:
         user_input = handle_user_input()
         if user_input == 2:
@@ -80,7 +100,8 @@ if __name__ == "__main__":
         time.sleep(1)
 
         # Register a hotkey (Ctrl + C) to save the results and exit the program
-        keyboard.add_hotkey("ctrl+c", lambda: sys.exit(0))
+        if STOP_HOTKEY is None:
+            STOP_HOTKEY = keyboard.add_hotkey("ctrl+c", stop_program)
 
         # Checks for a drop in menu
         while not pixel_search_in_window((38, 62, 107), DROP_CHECK_COORDS, shade=0):
@@ -102,53 +123,43 @@ if __name__ == "__main__":
 
             print((str(text).lower()).title())
 
-            # Split the extracted text into lines
-            lines = text.split("\n")
+            # The last non-empty line is the current category
+            lines = parse_lines(text)
+            CURRENT_CATEGORY = lines[-1] if lines else None
 
-            # Loop through the lines and categorize items
-            CURRENT_CATEGORY = None
-            for line in lines:
-                # Remove any leading/trailing whitespace
-                line = line.strip()
-
-                # If the line is not empty, set it as the current category
-                if line:
-                    CURRENT_CATEGORY = line
-
-            pyautogui.leftClick(WINDOW.left + 100, WINDOW.top + 280)
+            # Read the window position once for each group of clicks, so clicks
+            # follow the window if it moves during the drop
+            WINDOW_LEFT, WINDOW_TOP = WINDOW.topleft
+            pyautogui.leftClick(WINDOW_LEFT + 100, WINDOW_TOP + 280)
             time.sleep(1)
 
             while pixel_search_in_window((0, 2, 3), (70, 71, 920, 921), shade=0):
-                pyautogui.leftClick(WINDOW.left + 165, WINDOW.top + 910)
+                WINDOW_LEFT, WINDOW_TOP = WINDOW.topleft
+                pyautogui.leftClick(WINDOW_LEFT + 165, WINDOW_TOP + 910)
                 time.sleep(0.1)
-                pyautogui.leftClick(WINDOW.left + 850, WINDOW.top + 610)
+                pyautogui.leftClick(WINDOW_LEFT + 850, WINDOW_TOP + 610)
                 time.sleep(8)
 
                 image = grab_image(WINDOW, ITEM_OPEN_COORDS)
                 text = extract_text(image)
 
-                # Split the extracted text into lines
-                lines = text.split("\n")
-
-                # Loop through the lines and categorize items
-                for line in lines:
-                    # Remove any leading/trailing whitespace
-                    line = line.strip()
-
-                    # If the line is not empty, set it as the current category
-                    if line:
-                        print(f"Opened {(str(line).lower()).title()}\n")
-                        update_items(CURRENT_CATEGORY, line)
+                # Loop through the non-empty lines and categorize items
+                for line in parse_lines(text):
+                    print(f"Opened {(str(line).lower()).title()}\n")
+                    update_items(CURRENT_CATEGORY, line)
 
-                pyautogui.leftClick(WINDOW.left + 1050, WINDOW.top + 990)
+                WINDOW_LEFT, WINDOW_TOP = WINDOW.topleft
+                pyautogui.leftClick(WINDOW_LEFT + 1050, WINDOW_TOP + 990)
                 time.sleep(0.5)
             print("\nNo more Drop's left checking for more\n")
             sort_text_file()
-            pyautogui.leftClick(WINDOW.left + 130, WINDOW.top + 1030)
+            WINDOW_LEFT, WINDOW_TOP = WINDOW.topleft
+            pyautogui.leftClick(WINDOW_LEFT + 130, WINDOW_TOP + 1030)
             time.sleep(0.5)
 
     # Remove the hotkey when the program is exiting
-    keyboard.unhook_all()
+    if STOP_HOTKEY is not None:
+        keyboard.remove_hotkey(STOP_HOTKEY)
 
     # Close the program gracefully
     sys.exit(0)
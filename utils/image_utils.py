@@ -2,55 +2,119 @@
 This module contains utility functions for handling images in the Rocket League game.
 
 Functions:
+    grab_region: Capture a region of the screen.
     pixel_search_in_window: Search for a pixel of a specific color within a window.
-    color_match: Check if a color matches a target color within a certain shade tolerance.
 """
 
-from PIL import ImageGrab
+import threading
+
+import mss
+import numpy as np
+from PIL import Image
 from utils.window_utils import get_rl_window  # pylint: disable=E0401
 
+# Screen capture instances hold native display handles and are not thread-safe,
+# so one is kept per thread and reused between captures
+_capture = threading.local()
 
-def pixel_search_in_window(color, area, shade=None):
+
+def _grab_shot(bbox):
     """
-    Search for a pixel of a specific color within a window.
+    Capture a region of the screen with the current thread's capture instance.
 
     Args:
-        color (tuple): The target color.
-        area (tuple): A tuple containing the left, right, top, and bottom
-        boundaries of the search area.
-        shade (int, optional): The shade tolerance. Defaults to None.
+        bbox (tuple): The left, top, right, and bottom screen coordinates of the region.
 
     Returns:
-        tuple: The coordinates of the found pixel, or None if not found.
+        ScreenShot: The raw BGRA capture.
     """
-    left, right, top, bottom = area
-    window = get_rl_window()
-    bbox = (
-        window.left,
-        window.top,
-        window.left + window.width,
-        window.top + window.height,
+    sct = getattr(_capture, "sct", None)
+    if sct is None:
+        sct = _capture.sct = mss.mss()
+
+    left, top, right, bottom = bbox
+    return sct.grab(
+        {"left": left, "top": top, "width": right - left, "height": bottom - top}
     )
-    screenshot = ImageGrab.grab(bbox=bbox)
 
-    for x in range(left, right):
-        for y in range(top, bottom):
-            pixel_color = screenshot.getpixel((x, y))
-            if color_match(pixel_color, color, shade):
-                return x, y
-    return None
 
+def grab_region(bbox):
+    """
+    Capture a region of the screen.
+
+    Unlike ImageGrab, the screen capture instance is reused between calls
+    instead of reopening the display for every capture.
+
+    Args:
+        bbox (tuple): The left, top, right, and bottom screen coordinates of the region.
 
-def color_match(actual_color, target_color, shade):
+    Returns:
+        Image: The captured region as an RGB image.
     """
-    Check if a color matches a target color within a certain shade tolerance.
+    shot = _grab_shot(bbox)
+    return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+
+
+def _first_match(pixels, color, shade):
+    """
+    Find the first pixel within the shade tolerance of a color.
 
     Args:
-        actual_color (tuple): The actual color.
-        target_color (tuple): The target color.
+        pixels (numpy.ndarray): The pixels of the search area.
+        color (tuple): The target color.
         shade (int): The shade tolerance.
 
     Returns:
-        bool: True if the colors match within the shade tolerance, False otherwise.
+        tuple: The offset of the found pixel within the area, or None if not found.
     """
-    return all(abs(a - t) <= shade for a, t in zip(actual_color, target_color))
+    # Compare the whole area at once against the lowest and highest accepted
+    # value of each channel, keeping the pixels as uint8
+    pixels = pixels[..., : len(color)]
+    target = np.array(color, dtype=np.int16)
+    lower = np.clip(target - shade, 0, 255).astype(np.uint8)
+    upper = np.clip(target + shade, 0, 255).astype(np.uint8)
+    matches = np.all((pixels >= lower) & (pixels <= upper), axis=-1)
+
+    # Search column by column, the order the area has always been scanned in,
+    # taking only the first match rather than collecting every one
+    columns = matches.T
+    if columns.size:
+        index = int(columns.argmax())
+        if columns.flat[index]:
+            return divmod(index, columns.shape[1])
+    return None
+
+
+def pixel_search_in_window(color, area, shade=None):
+    """
+    Search for a pixel of a specific color within a window.
+
+    Args:
+        color (tuple): The target color.
+        area (tuple): A tuple containing the left, right, top, and bottom
+        boundaries of the search area.
+        shade (int, optional): The shade tolerance. Defaults to None.
+
+    Returns:
+        tuple: The coordinates of the found pixel, or None if not found.
+    """
+    left, right, top, bottom = area
+    if right <= left or bottom <= top:
+        return None
+
+    # Capture only the search area rather than the whole window
+    window_left, window_top = get_rl_window().topleft
+    bbox = (
+        window_left + left,
+        window_top + top,
+        window_left + right,
+        window_top + bottom,
+    )
+    # View the BGRA capture as RGB without building an image from it
+    pixels = np.asarray(_grab_shot(bbox))[..., 2::-1]
+
+    match = _first_match(pixels, color, shade)
+    if match is None:
+        return None
+    x, y = match
+    return left + x, top + y
@@ -3,14 +3,32 @@ This module contains utility functions for handling text in the Rocket League it
 
 Functions:
     clean_text: Cleans the input text by keeping only alphanumeric characters and spaces.
+    parse_lines: Splits text into its non-empty lines.
     get_rarity: Determines the rarity of an item.
 """
 
 import re
+from functools import lru_cache
 
 # Compile the regular expression for cleaning text
 CLEAN_TEXT_REGEX = re.compile(r"[^a-zA-Z0-9\s]")
 
+# The ASCII characters CLEAN_TEXT_REGEX deletes, for bytes.translate
+CLEAN_TEXT_DELETE = bytes(
+    code for code in range(128) if CLEAN_TEXT_REGEX.match(chr(code))
+)
+
+# Rarities paired with their normalized names, computed once at import.
+# "Very Rare" comes before "Rare" so it is matched first.
+RARITY_KEYWORDS = tuple(
+    (rarity, rarity.replace(" ", "").lower())
+    for rarity in ("Black Market", "Exotic", "Import", "Very Rare", "Rare", "Uncommon")
+)
+
+# Compile a single regular expression matching any normalized rarity name
+RARITY_REGEX = re.compile("|".join(keyword for _, keyword in RARITY_KEYWORDS))
+RARITY_BY_KEYWORD = {keyword: rarity for rarity, keyword in RARITY_KEYWORDS}
+
 
 def clean_text(text):
     """
@@ -22,24 +40,44 @@ def clean_text(text):
     Returns:
         str: The cleaned text.
     """
+    # OCR output is normally ASCII, which bytes.translate cleans without the regex
+    # engine. str.translate is no faster than the regex when deleting characters.
+    if text.isascii():
+        return text.encode().translate(None, CLEAN_TEXT_DELETE).decode()
+
     # Use the compiled regular expression to clean the text
     cleaned_text = CLEAN_TEXT_REGEX.sub("", text)
     return cleaned_text
 
 
+def parse_lines(text):
+    """
+    Splits text into its non-empty lines, with surrounding whitespace removed.
+
+    Args:
+        text (str): The text to be split.
+
+    Returns:
+        list: The stripped, non-empty lines of the text.
+    """
+    return [stripped for line in text.splitlines() if (stripped := line.strip())]
+
+
+@lru_cache(maxsize=4096)
 def get_rarity(item):
     """
     Determines the rarity of an item.
 
+    Results are cached, as the same item names are looked up repeatedly when
+    sorting and calculating probabilities.
+
     Args:
         item (str): The item whose rarity is to be determined.
 
     Returns:
         str: The rarity of the item. If the rarity is not recognized, returns "Unknown".
     """
-    rarities = {"Uncommon", "Very Rare", "Rare", "Import", "Exotic", "Black Market"}
-    item_no_spaces = item.replace(" ", "").lower()
-    for rarity in rarities:
-        if rarity.replace(" ", "").lower() in item_no_spaces:
-            return rarity
+    match = RARITY_REGEX.search(item.replace(" ", "").lower())
+    if match:
+        return RARITY_BY_KEYWORD[match.group()]
     return "Unknown"  # If rarity is not recognized
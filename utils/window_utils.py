@@ -5,8 +5,13 @@ Functions:
     get_rl_window: Finds the Rocket League window by its title and returns it.
 """
 
+import ctypes
+
 import pygetwindow as gw
 
+# Last Rocket League window found, reused while its handle stays valid
+_cached_window = {}
+
 
 def get_rl_window():
     """
@@ -15,9 +20,20 @@ def get_rl_window():
     This function finds the Rocket League window by its title and returns it.
     If the window is not found, it returns None.
 
+    The window found is reused on later calls for as long as its handle is
+    still valid, instead of enumerating every open window each time.
+
     Returns:
         window: The Rocket League window, or None if not found.
     """
+    window = _cached_window.get("window")
+    # IsWindow checks a single handle, unlike the title search which walks all windows
+    if window is not None and ctypes.windll.user32.IsWindow(
+        window._hWnd  # pylint: disable=protected-access
+    ):
+        return window
+
     # Find the Rocket League window by its title
     windows = gw.getWindowsWithTitle("Rocket League")
-    return windows[0] if windows else None
+    _cached_window["window"] = windows[0] if windows else None
+    return _cached_window["window"]